@@ -41,12 +41,13 @@ import matplotlib.pyplot as plt
 
 # %%
 plt.style.use("ggplot")
+rng = np.random.default_rng(0)
 
 # %% [markdown]
 # ## Datasets
 
 # %%
-df = pd.read_csv("iris.data", names=("sepal_length", "sepal_width", "petal_length", "petal_width", "class"))
+df = pd.read_csv("iris.data", names=("sepal_length", "sepal_width", "petal_length", "petal_width", "class"), dtype={"class": "category"})
 
 
 # %% [markdown]
@@ -57,19 +58,23 @@ df = pd.read_csv("iris.data", names=("sepal_length", "sepal_width", "petal_lengt
 
 # %% tags=[]
 def hist(attr, nbins, w, h):
-    data_min = df[attr].min()
-    data_max = df[attr].max()
-    data_range = data_max - data_min
-    bin_width = data_range / (nbins + 1)
+    values = df[attr].to_numpy()
+    classes = df["class"].cat.categories
+    class_idx = df["class"].cat.codes.to_numpy()
+
+    data_min = values.min()
+    data_max = values.max()
     bins = np.linspace(data_min, data_max, nbins + 1)
+
+    # Histograms of all classes in one pass - the second dimension has one bin per class
+    hists, _, _ = np.histogram2d(values, class_idx, bins=[bins, np.arange(len(classes) + 1)])
+    normed_hists = hists / np.sum(hists, axis=0)
     
     fig, ax = plt.subplots()
     fig.set_size_inches(w, h)
     
-    for i, (species, species_df) in enumerate(df.groupby("class")):
-        hist, _ = np.histogram(species_df[attr], bins)
-        normed_hist = hist / np.sum(hist)
-        ax.stairs(normed_hist, bins, fill=True, linewidth=1, edgecolor="black", alpha=0.6)
+    for i in range(len(classes)):
+        ax.stairs(normed_hists[:, i], bins, fill=True, linewidth=1, edgecolor="black", alpha=0.6)
 
 hist(attr="sepal_length", nbins=20, w=10, h=5)
 
@@ -79,12 +84,21 @@ hist(attr="sepal_length", nbins=20, w=10, h=5)
 
 # %%
 def ecdf_plot(attr, w, h):
+    values = df[attr].to_numpy()
+    class_idx = df["class"].cat.codes.to_numpy()
+
+    # Sort once by class and then by value, so that every class is a sorted contiguous slice
+    sorted_values = values[np.lexsort((values, class_idx))]
+    class_sizes = np.bincount(class_idx)
+    class_ends = np.cumsum(class_sizes)
+    class_starts = class_ends - class_sizes
+
     fig, ax = plt.subplots(1, 1)
     fig.set_size_inches(w, h)
     
-    for i, (species, species_df) in enumerate(df.groupby("class")):
-        vals = np.sort(species_df[attr])
-        quantiles = np.linspace(0, 1, len(species_df[attr]))
+    for start, end in zip(class_starts, class_ends):
+        vals = sorted_values[start:end]
+        quantiles = np.linspace(0, 1, end - start)
         ax.plot(vals, quantiles, "o", fillstyle="none")
 
 ecdf_plot("sepal_length", 8, 4)
@@ -101,16 +115,15 @@ def stripplot(ax, categories_and_observations, x_jitter=0.1, y_jitter=0.15):
     cat_count = 0
 
     for i, (category, observations) in enumerate(categories_and_observations):
-        x_vec = observations
-        x_jitter_vec = np.random.uniform(-x_jitter, x_jitter, len(observations))
+        observations = np.asarray(observations)
+        x_vec = observations + rng.uniform(-x_jitter, x_jitter, len(observations))
 
         y = ((cat_width/2.0) # top margin
              + (i * cat_width) # previous categories
              + (cat_width/2.0)) # center of the cat area
-        y_vec = y * np.ones(len(observations))
-        y_jitter_vec = np.random.uniform(-y_jitter, y_jitter, len(observations))
+        y_vec = y + rng.uniform(-y_jitter, y_jitter, len(observations))
 
-        ax.plot(x_vec + x_jitter_vec, y_vec + y_jitter_vec, 'o', alpha=0.5, markersize=10, linewidth=2)
+        ax.plot(x_vec, y_vec, 'o', alpha=0.5, markersize=10, linewidth=2)
 
         y_ticks.append(y)
         y_labels.append(category)
@@ -125,5 +138,5 @@ def stripplot(ax, categories_and_observations, x_jitter=0.1, y_jitter=0.15):
 fig, ax = plt.subplots()
 fig.set_size_inches(12, 4)
 fig.suptitle("Iris sepal length by species")
-sepal_length_by_species = ((group, values["sepal_length"]) for (group, values) in df.groupby("class"))
+sepal_length_by_species = ((group, values["sepal_length"]) for (group, values) in df.groupby("class", observed=True))
 stripplot(ax, sepal_length_by_species)
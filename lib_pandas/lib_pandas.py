@@ -122,6 +122,13 @@ df
 df = example_df()
 df[(df["Val2"] >= 4.0) & (df["Val2"] <= 6.0)]
 
+# %% [markdown]
+# The same selection can be written as a string expression with `.query()`, where comparisons can also be chained. When numexpr is installed, pandas evaluates the whole expression in a single pass instead of creating a temporary boolean series for each condition:
+
+# %%
+df = example_df()
+df.query("4.0 <= Val2 <= 6.0")
+
 # %% [markdown]
 # Use `.isin()` series method for subset selection:
 
@@ -129,6 +136,13 @@ df[(df["Val2"] >= 4.0) & (df["Val2"] <= 6.0)]
 df = example_df()
 df[df["Val2"].isin([4.0, 8.0])]
 
+# %% [markdown]
+# `.isin()` hashes the values of the whole series. When selecting just a couple of values from a long series, comparing with each value and combining the masks with `|` is usually much faster:
+
+# %%
+df = example_df()
+df[(df["Val2"] == 4.0) | (df["Val2"] == 8.0)]
+
 # %% [markdown]
 # ## Grouping
 
@@ -165,6 +179,46 @@ df.groupby("Cat").agg(val1_mean=("Val1", np.mean), val2_mean=("Val2", np.mean))
 df = example_df()
 df.groupby("Cat")["Val1"].agg(val1_mean=np.mean, val1_var=np.var)
 
+# %% [markdown]
+# Built-in aggregations can be compiled with numba by passing `engine="numba"`. Instead of calling back into Python once for every group, pandas runs a single compiled loop over all the groups (this requires numba to be installed):
+
+# %%
+df = example_df()
+df.groupby("Cat").agg("mean", engine="numba")
+
+# %% [markdown]
+# The groupby object can be stored and reused, so that the groups are computed only once for several aggregations:
+
+# %%
+df = example_df()
+df_groupby = df.groupby("Cat")["Val1"]
+df_groupby.max() - df_groupby.min()
+
+# %% [markdown]
+# Alternatively, compute all the needed aggregations with a single `agg()` call and combine the resulting columns:
+
+# %%
+df = example_df()
+val1_agg = df.groupby("Cat")["Val1"].agg(["max", "min"])
+val1_agg["max"] - val1_agg["min"]
+
+# %% [markdown]
+# Custom aggregation functions can also be compiled with `engine="numba"`. The function is then called with the values and the index of each group as numpy arrays, which makes it possible to compute the range in a single pass over the values:
+
+# %%
+def val_range(values, index):
+    v_min = values[0]
+    v_max = values[0]
+    for v in values[1:]:
+        if v < v_min:
+            v_min = v
+        elif v > v_max:
+            v_max = v
+    return v_max - v_min
+
+df = example_df()
+df.groupby("Cat")["Val1"].agg(val_range, engine="numba")
+
 # %% [markdown]
 # ### apply: reduce group-by-group
 
@@ -180,6 +234,13 @@ df.groupby("Cat")["Val1"].agg(val1_mean=np.mean, val1_var=np.var)
 df = example_df()
 df.groupby("Cat").apply(lambda df: df.mean())
 
+# %% [markdown]
+# `apply()` is the most flexible but also the slowest option, since `func` is a Python function called once per group. When the same result can be obtained with a built-in aggregation, prefer it - built-in aggregations are compiled and process all the groups in one pass:
+
+# %%
+df = example_df()
+df.groupby("Cat").mean()
+
 # %% [markdown]
 # ### transform: transform rows one-by-one
 
@@ -191,3 +252,10 @@ df.groupby("Cat").apply(lambda df: df.mean())
 # %%
 df = example_df()
 df.groupby("Cat").transform(lambda df: df.mean())
+
+# %% [markdown]
+# Just like with `agg()`, the name of a built-in aggregation can be passed instead of a function. pandas then computes the result in compiled code, without calling Python for every group:
+
+# %%
+df = example_df()
+df.groupby("Cat").transform("mean")